@@ -38,11 +38,20 @@ def main():
     print()
 
     # Run PyInstaller
+    # -O compiles the bundled bytecode without asserts. Not -OO: FastMCP reads
+    # tool descriptions from docstrings, which -OO would strip.
+    command = [sys.executable, "-O", "-m", "PyInstaller", "mcp-time-server.spec"]
+
+    # Compress the executable with UPX when it is available
+    upx = shutil.which("upx")
+    if upx:
+        print(f"Using UPX from {Path(upx).parent}")
+        command += ["--upx-dir", str(Path(upx).parent)]
+    else:
+        print("UPX not found, executable will not be compressed")
+
     print("Running PyInstaller...")
-    result = subprocess.run(
-        [sys.executable, "-m", "PyInstaller", "mcp-time-server.spec"],
-        capture_output=False
-    )
+    result = subprocess.run(command, capture_output=False)
 
     if result.returncode != 0:
         print("\nBuild failed!")
@@ -54,20 +63,33 @@ def main():
     print("=" * 60)
     print()
 
-    # Find the executable
+    # Find the executable inside the bundle directory
     if platform.system() == "Windows":
         exe_name = "mcp-time-server.exe"
+        archive_format = "zip"
     else:
         exe_name = "mcp-time-server"
+        archive_format = "gztar"  # tar keeps the executable bit
 
-    exe_path = dist_dir / exe_name
+    bundle_dir = dist_dir / "mcp-time-server"
+    exe_path = bundle_dir / exe_name
 
     if exe_path.exists():
-        size_mb = exe_path.stat().st_size / (1024 * 1024)
+        size_mb = sum(
+            f.stat().st_size for f in bundle_dir.rglob("*") if f.is_file()
+        ) / (1024 * 1024)
         print(f"Executable: {exe_path}")
-        print(f"Size: {size_mb:.2f} MB")
+        print(f"Bundle size: {size_mb:.2f} MB")
+
+        # Package the bundle directory as a single archive for distribution
+        archive = Path(shutil.make_archive(
+            str(bundle_dir), archive_format, root_dir=dist_dir, base_dir=bundle_dir.name
+        ))
+        archive_mb = archive.stat().st_size / (1024 * 1024)
+        print(f"Archive: {archive}")
+        print(f"Archive size: {archive_mb:.2f} MB")
         print()
-        print("You can now distribute this executable to other machines")
+        print("You can now distribute this archive to other machines")
         print(f"running {platform.system()} {platform.machine()}")
     else:
         print(f"Warning: Expected executable not found at {exe_path}")
@@ -6,14 +6,163 @@ Uses only standard library for cross-platform compatibility.
 
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo, available_timezones
+from functools import lru_cache
 from typing import Optional
+import re
 import time
 
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.tools import Tool
 
 # Initialize FastMCP server
 mcp = FastMCP("time-server")
 
+# English day and month names, indexed by weekday() and month - 1
+_DAYS = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+)
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+
+@lru_cache(maxsize=None)
+def _timezones() -> tuple[frozenset, tuple, tuple]:
+    """
+    Return the available timezone names as (set, sorted, sorted lowercase).
+    Built on first use rather than at import so server startup stays fast.
+    """
+    available = frozenset(available_timezones())
+    sorted_tzs = tuple(sorted(available))
+    return available, sorted_tzs, tuple(z.lower() for z in sorted_tzs)
+
+
+@lru_cache(maxsize=1024)
+def _zone(name: str) -> ZoneInfo:
+    """Return a cached ZoneInfo for the given timezone name."""
+    return ZoneInfo(name)
+
+
+# strptime already keeps compiled format regexes in _strptime's own cache, so
+# the second parse in compare_times reuses the first one's compiled pattern.
+@lru_cache(maxsize=4096)
+def _strptime_cached(date_string: str, format_string: str) -> datetime:
+    """Parse a datetime string, reusing the result for repeated inputs."""
+    return datetime.strptime(date_string, format_string)
+
+
+_DEFAULT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _fast_default_parse(date_string: str) -> Optional[datetime]:
+    """
+    Parse a "%Y-%m-%d %H:%M:%S" string by slicing.
+    Returns None when the string does not have that exact shape.
+    """
+    s = date_string
+    if s[4] + s[7] + s[10] + s[13] + s[16] != "-- ::":
+        return None
+    digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+    # isdigit() alone also accepts non-ASCII digits, which strptime rejects
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    return datetime(
+        int(s[0:4]), int(s[5:7]), int(s[8:10]),
+        int(s[11:13]), int(s[14:16]), int(s[17:19])
+    )
+
+
+def _parse(date_string: str, format_string: str) -> datetime:
+    """Parse a datetime string, skipping strptime for the default format."""
+    if format_string == _DEFAULT_FORMAT and len(date_string) == 19:
+        try:
+            dt = _fast_default_parse(date_string)
+        except ValueError:
+            # Out-of-range fields; let strptime produce its usual error
+            dt = None
+        if dt is not None:
+            return dt
+    return _strptime_cached(date_string, format_string)
+
+
+# Loose regex equivalents of common strptime directives, used to reject input
+# early in is_valid_datetime. They are meant to accept at least everything
+# strptime does; this was checked in the C locale, and the name and AM/PM
+# patterns are kept permissive (%p may be empty) to allow for other locales.
+_DIRECTIVE_PATTERNS = {
+    "Y": r"\d{4}",
+    "m": r"\s?\d{1,2}",
+    "d": r"\s?\d{1,2}",
+    "H": r"\s?\d{1,2}",
+    "I": r"\s?\d{1,2}",
+    "M": r"\s?\d{1,2}",
+    "S": r"\s?\d{1,2}",
+    "p": r".*?",
+    "A": r".+?",
+    "B": r".+?",
+    "%": r"%",
+}
+
+
+@lru_cache(maxsize=64)
+def _format_precheck(format_string: str) -> Optional[re.Pattern]:
+    """
+    Build a regex that cheaply rejects strings which cannot start with the
+    layout of format_string. Returns None when the format uses a directive
+    without a known pattern.
+    """
+    parts = []
+    i = 0
+    while i < len(format_string):
+        char = format_string[i]
+        if char == "%":
+            pattern = _DIRECTIVE_PATTERNS.get(format_string[i + 1:i + 2])
+            if pattern is None:
+                return None
+            parts.append(pattern)
+            i += 2
+        elif char.isspace():
+            # strptime treats any run of whitespace in the format as \s+
+            while i < len(format_string) and format_string[i].isspace():
+                i += 1
+            parts.append(r"\s+")
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    return re.compile("".join(parts), re.IGNORECASE)
+
+
+def _format_12h(dt: datetime) -> str:
+    """Format dt like strftime("%I:%M:%S %p")."""
+    hour = dt.hour % 12 or 12
+    meridiem = "PM" if dt.hour >= 12 else "AM"
+    return f"{hour:02d}:{dt.minute:02d}:{dt.second:02d} {meridiem}"
+
+
+def _format_human(dt: datetime) -> str:
+    """Format dt like strftime("%A, %B %d, %Y at %I:%M:%S %p")."""
+    return (
+        f"{_DAYS[dt.weekday()]}, {_MONTHS[dt.month - 1]} {dt.day:02d}, "
+        f"{dt.year} at {_format_12h(dt)}"
+    )
+
+
+def _format_offset(offset: Optional[timedelta]) -> str:
+    """Format a UTC offset like strftime("%z") without strftime."""
+    if offset is None:
+        return ""
+    sign = "-" if offset < timedelta(0) else "+"
+    offset = abs(offset)
+    hours, remainder = divmod(offset.seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    result = f"{sign}{hours:02d}{minutes:02d}"
+    if seconds or offset.microseconds:
+        result += f"{seconds:02d}"
+        if offset.microseconds:
+            result += f".{offset.microseconds:06d}"
+    return result
+
 
 @mcp.tool()
 def get_current_time(tz: Optional[str] = None) -> dict:
@@ -30,28 +179,33 @@ def get_current_time(tz: Optional[str] = None) -> dict:
     try:
         if tz:
             # Validate timezone
-            if tz not in available_timezones():
+            available, sorted_tzs, _ = _timezones()
+            if tz not in available:
                 return {
                     "error": f"Invalid timezone: {tz}",
-                    "available_timezones_sample": sorted(list(available_timezones()))[:10]
+                    "available_timezones_sample": list(sorted_tzs[:10])
                 }
 
-            now = datetime.now(ZoneInfo(tz))
+            now = datetime.now(_zone(tz))
+            timestamp = int(now.timestamp())
             tz_info = tz
         else:
-            now = datetime.now()
+            # Read the clock once so both fields describe the same instant
+            now_ts = time.time()
+            now = datetime.fromtimestamp(now_ts)
+            timestamp = int(now_ts)
             tz_info = "local"
 
         return {
             "datetime": now.isoformat(),
-            "date": now.strftime("%Y-%m-%d"),
-            "time": now.strftime("%H:%M:%S"),
-            "time_12h": now.strftime("%I:%M:%S %p"),
+            "date": now.date().isoformat(),
+            "time": now.time().isoformat("seconds"),
+            "time_12h": _format_12h(now),
             "timezone": tz_info,
-            "timezone_offset": now.strftime("%z"),
-            "day_of_week": now.strftime("%A"),
-            "unix_timestamp": int(now.timestamp()),
-            "formatted": now.strftime("%A, %B %d, %Y at %I:%M:%S %p")
+            "timezone_offset": _format_offset(now.utcoffset()),
+            "day_of_week": _DAYS[now.weekday()],
+            "unix_timestamp": timestamp,
+            "formatted": _format_human(now)
         }
     except Exception as e:
         return {"error": str(e)}
@@ -69,20 +223,21 @@ def get_timezone_info(tz: str) -> dict:
         Dictionary containing timezone information
     """
     try:
-        if tz not in available_timezones():
+        if tz not in _timezones()[0]:
             return {
                 "error": f"Invalid timezone: {tz}",
                 "hint": "Use list_timezones to see available options"
             }
 
-        zone = ZoneInfo(tz)
+        zone = _zone(tz)
         now = datetime.now(zone)
+        offset = now.utcoffset()
 
         return {
             "timezone": tz,
             "current_time": now.isoformat(),
-            "offset": now.strftime("%z"),
-            "offset_hours": now.utcoffset().total_seconds() / 3600 if now.utcoffset() else 0,
+            "offset": _format_offset(offset),
+            "offset_hours": offset.total_seconds() / 3600 if offset else 0,
             "abbreviation": now.strftime("%Z")
         }
     except Exception as e:
@@ -101,11 +256,17 @@ def list_timezones(filter_text: Optional[str] = None) -> dict:
         Dictionary containing list of timezone names
     """
     try:
-        zones = sorted(list(available_timezones()))
+        _, sorted_tzs, sorted_tzs_lower = _timezones()
 
         if filter_text:
             filter_lower = filter_text.lower()
-            zones = [z for z in zones if filter_lower in z.lower()]
+            zones = [
+                sorted_tzs[i]
+                for i, z in enumerate(sorted_tzs_lower)
+                if filter_lower in z
+            ]
+        else:
+            zones = list(sorted_tzs)
 
         return {
             "count": len(zones),
@@ -136,17 +297,18 @@ def parse_datetime(
         Dictionary containing parsed datetime information
     """
     try:
-        dt = datetime.strptime(date_string, format_string)
+        dt = _parse(date_string, format_string)
+        now = datetime.now()
 
         return {
             "original": date_string,
             "parsed": dt.isoformat(),
-            "date": dt.strftime("%Y-%m-%d"),
-            "time": dt.strftime("%H:%M:%S"),
-            "day_of_week": dt.strftime("%A"),
+            "date": dt.date().isoformat(),
+            "time": dt.time().isoformat("seconds"),
+            "day_of_week": _DAYS[dt.weekday()],
             "unix_timestamp": int(dt.timestamp()),
-            "is_past": dt < datetime.now(),
-            "is_future": dt > datetime.now()
+            "is_past": dt < now,
+            "is_future": dt > now
         }
     except ValueError as e:
         return {
@@ -157,6 +319,56 @@ def parse_datetime(
         return {"error": str(e)}
 
 
+@mcp.tool()
+def parse_datetimes(
+    date_strings: list[str],
+    format_string: str = "%Y-%m-%d %H:%M:%S"
+) -> dict:
+    """
+    Parse many date/time strings that share one format.
+    Each distinct string is parsed only once.
+
+    Args:
+        date_strings: The date/time strings to parse
+        format_string: The format of every input string (default: "%Y-%m-%d %H:%M:%S")
+
+    Returns:
+        Dictionary of lists parallel to date_strings. Entries that fail to
+        parse are None in "parsed" and "unix_timestamp" and carry a message
+        in "errors". Entries that parse but have no Unix timestamp keep
+        "parsed", are None in "unix_timestamp" and also carry a message.
+    """
+    try:
+        parsed = {}
+        for date_string in dict.fromkeys(date_strings):
+            try:
+                dt = _parse(date_string, format_string)
+            except ValueError as e:
+                parsed[date_string] = (None, None, f"Failed to parse date: {str(e)}")
+                continue
+
+            # Dates near the ends of the range (or before 1970 on Windows)
+            # parse fine but have no local Unix timestamp
+            try:
+                parsed[date_string] = (dt.isoformat(), int(dt.timestamp()), None)
+            except (ValueError, OverflowError, OSError) as e:
+                parsed[date_string] = (
+                    dt.isoformat(), None, f"Failed to compute timestamp: {str(e)}"
+                )
+
+        results = [parsed[date_string] for date_string in date_strings]
+
+        return {
+            "count": len(results),
+            "unique_count": len(parsed),
+            "parsed": [r[0] for r in results],
+            "unix_timestamp": [r[1] for r in results],
+            "errors": [r[2] for r in results]
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
 @mcp.tool()
 def compare_times(
     time1: str,
@@ -175,8 +387,8 @@ def compare_times(
         Dictionary containing comparison information
     """
     try:
-        dt1 = datetime.strptime(time1, format_string)
-        dt2 = datetime.strptime(time2, format_string)
+        dt1 = _parse(time1, format_string)
+        dt2 = _parse(time2, format_string)
 
         diff = dt2 - dt1
         abs_diff = abs(diff)
@@ -234,20 +446,21 @@ def add_time_delta(
         Dictionary containing the new datetime
     """
     try:
-        dt = datetime.strptime(base_time, format_string)
-        delta = timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
-        new_dt = dt + delta
+        dt = _parse(base_time, format_string)
+        # Echoed back as-is, and doubles as the timedelta arguments
+        delta_applied = {
+            "days": days,
+            "hours": hours,
+            "minutes": minutes,
+            "seconds": seconds
+        }
+        new_dt = dt + timedelta(**delta_applied)
 
         return {
             "original": dt.isoformat(),
-            "delta_applied": {
-                "days": days,
-                "hours": hours,
-                "minutes": minutes,
-                "seconds": seconds
-            },
+            "delta_applied": delta_applied,
             "result": new_dt.isoformat(),
-            "formatted": new_dt.strftime("%A, %B %d, %Y at %I:%M:%S %p"),
+            "formatted": _format_human(new_dt),
             "unix_timestamp": int(new_dt.timestamp())
         }
     except ValueError as e:
@@ -275,7 +488,17 @@ def is_valid_datetime(
         Dictionary indicating whether the datetime is valid
     """
     try:
-        dt = datetime.strptime(date_string, format_string)
+        precheck = _format_precheck(format_string)
+        # Only a prefix check: strings with extra trailing text still go to
+        # strptime so it can report its more specific error
+        if precheck is not None and not precheck.match(date_string):
+            return {
+                "valid": False,
+                "error": f"date_string {date_string!r} does not follow the layout of format {format_string!r}",
+                "message": "Failed to parse datetime with given format"
+            }
+
+        dt = _parse(date_string, format_string)
         return {
             "valid": True,
             "parsed": dt.isoformat(),
@@ -311,21 +534,21 @@ def unix_to_datetime(
     """
     try:
         if tz:
-            if tz not in available_timezones():
+            if tz not in _timezones()[0]:
                 return {
                     "error": f"Invalid timezone: {tz}",
                     "hint": "Use list_timezones to see available options"
                 }
-            dt = datetime.fromtimestamp(timestamp, ZoneInfo(tz))
+            dt = datetime.fromtimestamp(timestamp, _zone(tz))
         else:
             dt = datetime.fromtimestamp(timestamp)
 
         return {
             "unix_timestamp": timestamp,
             "datetime": dt.isoformat(),
-            "date": dt.strftime("%Y-%m-%d"),
-            "time": dt.strftime("%H:%M:%S"),
-            "formatted": dt.strftime("%A, %B %d, %Y at %I:%M:%S %p"),
+            "date": dt.date().isoformat(),
+            "time": dt.time().isoformat("seconds"),
+            "formatted": _format_human(dt),
             "timezone": tz if tz else "local"
         }
     except (ValueError, OSError) as e:
@@ -337,6 +560,60 @@ def unix_to_datetime(
         return {"error": str(e)}
 
 
+# Tools that can be dispatched in-process by batch_execute. Wrapping them as
+# FastMCP Tools gives each operation the same argument validation and coercion
+# as a direct tool call.
+_BATCH_TOOLS = {
+    fn.__name__: Tool.from_function(fn)
+    for fn in (
+        get_current_time,
+        get_timezone_info,
+        list_timezones,
+        parse_datetime,
+        parse_datetimes,
+        compare_times,
+        add_time_delta,
+        is_valid_datetime,
+        unix_to_datetime,
+    )
+}
+
+
+@mcp.tool()
+async def batch_execute(operations: list[dict]) -> dict:
+    """
+    Run several time tools in a single call.
+
+    Args:
+        operations: List of operations, each a dictionary with a "tool" name
+                    and an optional "args" dictionary of keyword arguments.
+                    Example: [{"tool": "get_current_time", "args": {"tz": "UTC"}}]
+
+    Returns:
+        Dictionary containing one result per operation, in order
+    """
+    results = []
+    for operation in operations:
+        try:
+            name = operation.get("tool")
+            tool = _BATCH_TOOLS.get(name)
+            if tool is None:
+                results.append({
+                    "error": f"Unknown tool: {name}",
+                    "available_tools": list(_BATCH_TOOLS)
+                })
+                continue
+
+            results.append(await tool.run(operation.get("args") or {}))
+        except Exception as e:
+            results.append({"error": str(e)})
+
+    return {
+        "count": len(results),
+        "results": results
+    }
+
+
 if __name__ == "__main__":
     # Run the server
     mcp.run()
@@ -4,16 +4,25 @@ Simple test script to verify time tools work correctly
 Run with: python test_tools.py
 """
 
+import asyncio
+import json
 from datetime import datetime
+from zoneinfo import ZoneInfo
 from server import (
+    mcp,
     get_current_time,
     get_timezone_info,
     list_timezones,
     parse_datetime,
+    parse_datetimes,
     compare_times,
     add_time_delta,
     is_valid_datetime,
     unix_to_datetime,
+    batch_execute,
+    _format_12h,
+    _format_human,
+    _format_offset,
 )
 
 
@@ -58,6 +67,55 @@ def test_parse_datetime():
     print()
 
 
+def test_parse_datetimes():
+    print("Testing parse_datetimes...")
+    result = parse_datetimes([
+        "2025-11-21 14:30:00",
+        "bad",
+        "2025-11-21 14:30:00",
+    ])
+    assert result["count"] == 3
+    assert result["unique_count"] == 2
+    assert result["parsed"][0] == result["parsed"][2] == "2025-11-21T14:30:00"
+    assert result["parsed"][1] is None
+    assert result["errors"][1] is not None
+    print(f"  ✓ Parsed {result['count']} strings ({result['unique_count']} unique)")
+
+    result = parse_datetimes(["0001-01-01 00:00:00", "2025-11-21 14:30:00"])
+    assert result["parsed"][0] == "0001-01-01T00:00:00"
+    assert result["unix_timestamp"][0] is None
+    assert "timestamp" in result["errors"][0]
+    assert result["unix_timestamp"][1] is not None
+    assert result["errors"][1] is None
+    print(f"  ✓ Timestamp failure kept to its own entry")
+    print()
+
+
+def test_default_format_parsing():
+    print("Testing default format parsing...")
+    fmt = "%Y-%m-%d %H:%M:%S"
+    cases = [
+        "2025-11-21 14:30:00",
+        "٢٠٢٥-٠١-٢١ ١٤:٣٠:٠٠",
+        "2025-01-21 ١٤:30:00",
+        "٢٠٢٥-01-21 14:30:00",
+        "2025-13-01 00:00:00",
+        "2025-01-01 24:00:00",
+        "2025-01-21\t14:30:00",
+        "2025-01-21  4:30:00",
+    ]
+    for case in cases:
+        try:
+            expected = datetime.strptime(case, fmt).isoformat()
+        except ValueError:
+            expected = None
+        result = parse_datetime(case, fmt)
+        assert result.get("parsed") == expected, (case, result)
+        assert is_valid_datetime(case, fmt)["valid"] is (expected is not None), case
+    print(f"  ✓ Matches strptime for {len(cases)} edge cases")
+    print()
+
+
 def test_compare_times():
     print("Testing compare_times...")
     result = compare_times(
@@ -88,9 +146,22 @@ def test_is_valid_datetime():
     assert result["valid"] is True
     print(f"  ✓ Valid datetime recognized")
 
+    result = is_valid_datetime("2025-1-5 7:03:09")
+    assert result["valid"] is True
+    print(f"  ✓ Unpadded datetime recognized")
+
     result = is_valid_datetime("not a date")
     assert result["valid"] is False
     print(f"  ✓ Invalid datetime rejected")
+
+    result = is_valid_datetime("2025-11-21 14:30:00", "%Y-%m-%d")
+    assert result["valid"] is False
+    assert "unconverted data remains" in result["error"]
+    print(f"  ✓ Trailing data reported by strptime")
+
+    result = is_valid_datetime("2025-02-30 10:00:00")
+    assert result["valid"] is False
+    print(f"  ✓ Out-of-range datetime rejected")
     print()
 
 
@@ -102,6 +173,55 @@ def test_unix_to_datetime():
     print()
 
 
+def test_batch_execute():
+    print("Testing batch_execute...")
+    result = asyncio.run(batch_execute([
+        {"tool": "get_current_time", "args": {"tz": "UTC"}},
+        {"tool": "is_valid_datetime", "args": {"date_string": "not a date"}},
+        {"tool": "no_such_tool"},
+    ]))
+    assert result["count"] == 3
+    assert result["results"][0]["timezone"] == "UTC"
+    assert result["results"][1]["valid"] is False
+    assert "error" in result["results"][2]
+    print(f"  ✓ Ran {result['count']} operations in one call")
+
+    # Arguments are coerced the same way as in a direct tool call
+    args = {"timestamp": "1732204800", "tz": "UTC"}
+    direct = asyncio.run(mcp.call_tool("unix_to_datetime", args))
+    batched = asyncio.run(batch_execute([{"tool": "unix_to_datetime", "args": args}]))
+    assert batched["results"][0] == json.loads(direct[0].text)
+    print(f"  ✓ Batched arguments validated like direct calls")
+    print()
+
+
+def test_human_formatting():
+    print("Testing 12-hour and human-readable formatting...")
+    for dt in [
+        datetime(2025, 11, 21, 0, 0, 0),
+        datetime(2025, 11, 21, 0, 5, 9),
+        datetime(2025, 11, 21, 12, 0, 0),
+        datetime(2025, 11, 21, 12, 59, 59),
+        datetime(2025, 1, 5, 23, 30, 0),
+    ]:
+        assert _format_12h(dt) == dt.strftime("%I:%M:%S %p"), dt
+        assert _format_human(dt) == dt.strftime("%A, %B %d, %Y at %I:%M:%S %p"), dt
+    print(f"  ✓ Matches strftime at midnight and noon")
+    print()
+
+
+def test_offset_formatting():
+    print("Testing UTC offset formatting...")
+    for tz in ["UTC", "America/New_York", "America/St_Johns", "Asia/Kolkata"]:
+        for month in (1, 7):
+            dt = datetime(2025, month, 15, 12, 0, 0, tzinfo=ZoneInfo(tz))
+            assert _format_offset(dt.utcoffset()) == dt.strftime("%z"), (tz, month)
+    naive = datetime(2025, 11, 21, 14, 30, 0)
+    assert _format_offset(naive.utcoffset()) == naive.strftime("%z") == ""
+    print(f"  ✓ Matches strftime for negative, half-hour and naive offsets")
+    print()
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Testing MCP Time Server Tools")
@@ -113,10 +233,15 @@ if __name__ == "__main__":
         test_timezone_info()
         test_list_timezones()
         test_parse_datetime()
+        test_parse_datetimes()
+        test_default_format_parsing()
         test_compare_times()
         test_add_time_delta()
         test_is_valid_datetime()
         test_unix_to_datetime()
+        test_batch_execute()
+        test_human_formatting()
+        test_offset_formatting()
 
         print("=" * 60)
         print("All tests passed! ✓")